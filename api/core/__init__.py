@@ -16,7 +16,18 @@ def create_app():
     app.config["SQLALCHEMY_DATABASE_URI"] = (
         f"postgresql://{db_login[0]}:{db_login[1]}@"
         f"{db_login[2]}:{db_login[3]}/{db_login[4]}"
+        "?application_name=satchecker"
     )
+    # Keep a warm connection pool per gunicorn worker so requests skip the
+    # TCP/TLS/auth handshake; LIFO checkout keeps a small working set of
+    # connections hot, and pre-ping drops stale ones after idle periods.
+    app.config["SQLALCHEMY_ENGINE_OPTIONS"] = {
+        "pool_size": 10,
+        "max_overflow": 20,
+        "pool_pre_ping": True,
+        "pool_recycle": 1800,
+        "pool_use_lifo": True,
+    }
     return app
 
 
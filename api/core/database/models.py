@@ -7,6 +7,10 @@ from zoneinfo import ZoneInfo
 
 class Satellite(db.Model):
     __tablename__ = "satellites"
+    __table_args__ = (
+        db.Index("ix_satellites_sat_name", "sat_name"),
+        db.Index("ix_satellites_sat_number", "sat_number"),
+    )
 
     id = db.Column(db.Integer, primary_key=True)
     sat_number = db.Column(db.String())
@@ -30,6 +34,10 @@ class Satellite(db.Model):
 
 class TLE(db.Model):
     __tablename__ = "tle"
+    __table_args__ = (
+        db.Index("ix_tle_sat_id_epoch", "sat_id", "epoch"),
+        db.Index("ix_tle_sat_id_date_collected", "sat_id", "date_collected"),
+    )
 
     id = db.Column(db.Integer, primary_key=True)
     sat_id = db.Column(db.Integer(), db.ForeignKey("satellites.id"))
@@ -39,7 +47,9 @@ class TLE(db.Model):
     is_supplemental = db.Column(db.Boolean())
     data_source = db.Column(db.String())
     epoch = db.Column(db.DateTime())
-    tle_satellite = db.relationship("database.models.Satellite", lazy="joined")
+    # no query needs implicit satellite hydration anymore; raise if a code
+    # path silently depends on it so the join is always an explicit opt-in
+    tle_satellite = db.relationship("database.models.Satellite", lazy="raise")
 
     def __init__(
         self,
@@ -60,4 +70,4 @@ class TLE(db.Model):
         self.epoch = epoch
 
     def __repr__(self):
-        return f"<TLE {self.tle_satellite}>"
+        return f"<TLE {self.sat_id}>"
@@ -1,5 +1,5 @@
 from flask import abort
-from sqlalchemy import and_
+from sqlalchemy import and_, select
 from sqlalchemy.exc import DataError
 
 from .. import error_messages
@@ -8,26 +8,24 @@ from . import models
 
 
 def get_ids_for_satelltite_name(satellite_name):
-    norad_ids_and_dates = (
-        db.session.query(
+    norad_ids_and_dates = db.session.execute(
+        select(
             models.Satellite.sat_number,
             models.Satellite.date_added,
         )
-        .filter(models.Satellite.sat_name == satellite_name)
+        .where(models.Satellite.sat_name == satellite_name)
         .order_by(models.Satellite.date_added.desc())
-        .all()
-    )
+    ).all()
 
     return norad_ids_and_dates
 
 
 def get_names_for_satellite_id(satellite_id):
-    satellite_names_and_dates = (
-        db.session.query(models.Satellite.sat_name, models.Satellite.date_added)
-        .filter(models.Satellite.sat_number == satellite_id)
+    satellite_names_and_dates = db.session.execute(
+        select(models.Satellite.sat_name, models.Satellite.date_added)
+        .where(models.Satellite.sat_number == satellite_id)
         .order_by(models.Satellite.date_added.desc())
-        .all()
-    )
+    ).all()
 
     return satellite_names_and_dates
 
@@ -51,15 +49,23 @@ def get_tles(satellite_id, id_type, start_date, end_date):
     elif id_type == "name":
         satellite_filter.append(models.Satellite.sat_name == satellite_id)
 
+    # select only the columns the response needs so no ORM objects (and no
+    # joined-relationship hydration) are built for these read-only rows
     try:
-        tle_data = (
-            db.session.query(models.TLE)
+        tle_data = db.session.execute(
+            select(
+                models.Satellite.sat_name,
+                models.Satellite.sat_number,
+                models.TLE.tle_line1,
+                models.TLE.tle_line2,
+                models.TLE.epoch,
+                models.TLE.date_collected,
+            )
             .join(models.Satellite, models.TLE.sat_id == models.Satellite.id)
-            .filter(and_(*satellite_filter))
-            .filter(and_(*date_filter))
+            .where(and_(*satellite_filter))
+            .where(and_(*date_filter))
             .order_by(models.TLE.date_collected.desc())
-            .all()
-        )
+        ).all()
         return tle_data
 
     except Exception as e:
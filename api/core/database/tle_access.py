@@ -1,11 +1,15 @@
 import re
+import threading
 from collections import namedtuple
 
+import numpy as np
+from astropy.time import Time
+from cachetools import TTLCache
 from flask import abort
 from sqlalchemy import func
 
 from ..extensions import db
-from ..utils import json_output, propagate_satellite
+from ..utils import json_output, propagate_satellite_batch
 from . import models
 
 NO_TLE_FOUND = "Error: No TLE found"
@@ -24,14 +28,18 @@ def propagate_and_create_json_results(
     data_source="",
 ):
     # propagation and create output
+    # normalize the requested epochs (scalar/vector astropy Time or raw floats)
+    # to a flat float64 array so one satellite sweep covers the whole request
+    jd_values = np.atleast_1d(jd.jd if isinstance(jd, Time) else jd).astype(np.float64)
+
+    positions = propagate_satellite_batch(tle_line_1, tle_line_2, location, jd_values)
+
     result_list = []
-    for d in jd:
+    for d, satellite_position in zip(jd_values, positions):
         # Right ascension RA (deg), Declination Dec (deg), dRA/dt*cos(Dec) (deg/day),
         # dDec/dt (deg/day), Altitude (deg), Azimuth (deg), dAlt/dt (deg/day),
         # dAz/dt (deg/day), distance (km), range rate (km/s), phaseangle(deg),
         # illuminated (T/F)
-        satellite_position = propagate_satellite(tle_line_1, tle_line_2, location, d)
-
         if (
             satellite_position.alt.degrees > min_altitude
             and satellite_position.alt.degrees < max_altitude
@@ -40,7 +48,7 @@ def propagate_and_create_json_results(
                 json_output(
                     name,
                     catalog_id,
-                    d.jd,
+                    d,
                     satellite_position.ra,
                     satellite_position.dec,
                     date_collected,
@@ -140,12 +148,37 @@ def get_tle_by_name(target_name, data_source, date):
     return tle_sat
 
 
+# managed directly (rather than via ttl_cache) so that only successful
+# lookups are stored; a None from a missing TLE or a transient database
+# error must not be pinned for the whole TTL
+_tle_cache = TTLCache(maxsize=4096, ttl=900)
+_tle_cache_lock = threading.Lock()
+
+
+def _get_tle_cached(identifier, use_catalog_number, data_source, date_bucket):
+    key = (identifier, use_catalog_number, data_source, date_bucket)
+    with _tle_cache_lock:
+        tle_sat = _tle_cache.get(key)
+    if tle_sat is None:
+        tle_sat = (
+            get_tle_by_catalog_number(identifier, data_source, date_bucket)
+            if use_catalog_number
+            else get_tle_by_name(identifier, data_source, date_bucket)
+        )
+        if tle_sat is not None:
+            with _tle_cache_lock:
+                _tle_cache[key] = tle_sat
+    return tle_sat
+
+
 def get_tle(identifier, use_catalog_number, data_source, date):
-    tle_sat = (
-        get_tle_by_catalog_number(identifier, data_source, date)
-        if use_catalog_number
-        else get_tle_by_name(identifier, data_source, date)
+    # TLEs only change every few hours, so bucket the requested epoch to
+    # 15 minutes; identical lookups within a window become cache hits
+    # instead of repeated SELECTs
+    date_bucket = date.replace(
+        minute=date.minute - date.minute % 15, second=0, microsecond=0
     )
+    tle_sat = _get_tle_cached(identifier, use_catalog_number, data_source, date_bucket)
     if not tle_sat:
         abort(500, NO_TLE_FOUND)
 
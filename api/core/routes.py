@@ -1,10 +1,11 @@
 #!/usr/bin/python3
 from datetime import timezone
 
+import orjson
 import requests
-from astropy.time import Time
-from flask import abort, jsonify, redirect, request
-from sqlalchemy.exc import DataError
+from cachetools.func import ttl_cache
+from flask import abort, redirect, request
+from sqlalchemy.exc import DataError, SQLAlchemyError
 
 from core import app, limiter
 from core.database.satellite_access import (
@@ -19,13 +20,128 @@ from core.database.tle_access import (
 )
 from core.utils import (
     extract_parameters,
+    format_date,
     get_forwarded_address,
     jd_arange,
+    jd_to_datetime,
     validate_parameters,
 )
 
 from . import error_messages
 
+# Query parameter names per endpoint, hoisted to module level so request
+# handling does not rebuild the lists on every call
+NAME_PARAMETERS = (
+    "name",
+    "latitude",
+    "longitude",
+    "elevation",
+    "julian_date",
+    "min_altitude",
+    "max_altitude",
+    "data_source",
+)
+NAME_REQUIRED = ("name", "latitude", "longitude", "elevation", "julian_date")
+NAME_JDSTEP_PARAMETERS = (
+    "name",
+    "latitude",
+    "longitude",
+    "elevation",
+    "startjd",
+    "stopjd",
+    "stepjd",
+    "min_altitude",
+    "max_altitude",
+    "data_source",
+)
+NAME_JDSTEP_REQUIRED = (
+    "name",
+    "latitude",
+    "longitude",
+    "elevation",
+    "startjd",
+    "stopjd",
+)
+CATALOG_PARAMETERS = (
+    "catalog",
+    "latitude",
+    "longitude",
+    "elevation",
+    "julian_date",
+    "min_altitude",
+    "max_altitude",
+    "data_source",
+)
+CATALOG_REQUIRED = ("catalog", "latitude", "longitude", "elevation", "julian_date")
+CATALOG_JDSTEP_PARAMETERS = (
+    "catalog",
+    "latitude",
+    "longitude",
+    "elevation",
+    "startjd",
+    "stopjd",
+    "stepjd",
+    "min_altitude",
+    "max_altitude",
+    "data_source",
+)
+CATALOG_JDSTEP_REQUIRED = (
+    "catalog",
+    "latitude",
+    "longitude",
+    "elevation",
+    "startjd",
+    "stopjd",
+)
+TLE_PARAMETERS = (
+    "tle",
+    "latitude",
+    "longitude",
+    "elevation",
+    "julian_date",
+    "min_altitude",
+    "max_altitude",
+)
+TLE_REQUIRED = ("tle", "latitude", "longitude", "elevation", "julian_date")
+TLE_JDSTEP_PARAMETERS = (
+    "tle",
+    "latitude",
+    "longitude",
+    "elevation",
+    "startjd",
+    "stopjd",
+    "stepjd",
+    "min_altitude",
+    "max_altitude",
+)
+TLE_JDSTEP_REQUIRED = ("tle", "latitude", "longitude", "elevation", "startjd", "stopjd")
+
+
+def forwarded_address_key():
+    """Rate-limit key: the forwarded client address of the current request."""
+    return get_forwarded_address(request)
+
+
+# pooled session for the upstream health probe so repeated probes reuse the
+# TCP/TLS connection instead of paying DNS + handshake each time
+_upstream_session = requests.Session()
+_upstream_session.mount(
+    "https://", requests.adapters.HTTPAdapter(pool_connections=4, pool_maxsize=4)
+)
+
+
+def json_response(data):
+    """Serialize data with orjson and wrap it in a JSON response.
+
+    orjson serializes the large list responses (and any numpy scalars the
+    propagation produces) at C speed, unlike flask.jsonify which goes
+    through the stdlib encoder.
+    """
+    return app.response_class(
+        orjson.dumps(data, option=orjson.OPT_SERIALIZE_NUMPY),
+        mimetype="application/json",
+    )
+
 
 # Error handling
 @app.errorhandler(404)
@@ -60,29 +176,35 @@ def internal_server_error(e):
 # Redirects user to the Center for the Protection of Dark and Quiet Sky homepage
 @app.route("/")
 @app.route("/index")
-@limiter.limit(
-    "100 per second, 2000 per minute", key_func=lambda: get_forwarded_address(request)
-)
+@limiter.limit("100 per second, 2000 per minute", key_func=forwarded_address_key)
 def root():
     return redirect("https://satchecker.readthedocs.io/en/latest/")
 
 
-@app.route("/health")
-@limiter.exempt
-def health():
+@ttl_cache(maxsize=1, ttl=30)
+def _upstream_healthy():
+    # cache the probe result for 30s so bursts of health checks collapse to
+    # one upstream request instead of each blocking a worker
     try:
-        response = requests.get("https://cps.iau.org/tools/satchecker/api/", timeout=10)
+        response = _upstream_session.get(
+            "https://cps.iau.org/tools/satchecker/api/", timeout=2.0
+        )
         response.raise_for_status()
     except Exception:
+        return False
+    return True
+
+
+@app.route("/health")
+@limiter.exempt
+def health():
+    if not _upstream_healthy():
         abort(503, "Error: Unable to connect to IAU CPS URL")
-    else:
-        return {"message": "Healthy"}
+    return {"message": "Healthy"}
 
 
 @app.route("/ephemeris/name/")
-@limiter.limit(
-    "100 per second, 2000 per minute", key_func=lambda: get_forwarded_address(request)
-)
+@limiter.limit("100 per second, 2000 per minute", key_func=forwarded_address_key)
 def get_ephemeris_by_name():
     """Returns satellite location and velocity information relative to the observer's
     coordinates for the given satellite's Two Line Element Data Set at a specified
@@ -117,36 +239,22 @@ def get_ephemeris_by_name():
     response: 'dictionary'
         JSON output with satellite information - see json_output() for format
     """
-    parameters = extract_parameters(
-        request,
-        [
-            "name",
-            "latitude",
-            "longitude",
-            "elevation",
-            "julian_date",
-            "min_altitude",
-            "max_altitude",
-            "data_source",
-        ],
-    )
+    parameters = extract_parameters(request, NAME_PARAMETERS)
 
-    parameters = validate_parameters(
-        parameters, ["name", "latitude", "longitude", "elevation", "julian_date"]
-    )
+    parameters = validate_parameters(parameters, NAME_REQUIRED)
 
     # Test JD format
     try:
-        jd = Time(parameters["julian_date"], format="jd", scale="ut1")
-    except Exception:
+        jd = float(parameters["julian_date"])
+    except ValueError:
         abort(500, error_messages.INVALID_JD)
 
     tle = get_tle(
-        parameters["name"], False, parameters["data_source"], jd.to_datetime()
+        parameters["name"], False, parameters["data_source"], jd_to_datetime(jd)
     )
-    return propagate_and_create_json_results(
+    results = propagate_and_create_json_results(
         parameters["location"],
-        [jd],
+        jd,
         tle[0].tle_line1,
         tle[0].tle_line2,
         tle[0].date_collected,
@@ -156,12 +264,11 @@ def get_ephemeris_by_name():
         tle[1].sat_number,
         parameters["data_source"],
     )
+    return json_response(results)
 
 
 @app.route("/ephemeris/name-jdstep/")
-@limiter.limit(
-    "100 per second, 2000 per minute", key_func=lambda: get_forwarded_address(request)
-)
+@limiter.limit("100 per second, 2000 per minute", key_func=forwarded_address_key)
 def get_ephemeris_by_name_jdstep():
     """Returns satellite location and velocity information relative to the observer's
     coordinates for the given satellite's name with the Two Line Element Data Set at
@@ -201,25 +308,9 @@ def get_ephemeris_by_name_jdstep():
         JSON output with satellite information - see json_output() for format
     """
 
-    parameters = extract_parameters(
-        request,
-        [
-            "name",
-            "latitude",
-            "longitude",
-            "elevation",
-            "startjd",
-            "stopjd",
-            "stepjd",
-            "min_altitude",
-            "max_altitude",
-            "data_source",
-        ],
-    )
+    parameters = extract_parameters(request, NAME_JDSTEP_PARAMETERS)
 
-    parameters = validate_parameters(
-        parameters, ["name", "latitude", "longitude", "elevation", "startjd", "stopjd"]
-    )
+    parameters = validate_parameters(parameters, NAME_JDSTEP_REQUIRED)
 
     jd0 = float(parameters["startjd"])
     jd1 = float(parameters["stopjd"])
@@ -233,9 +324,9 @@ def get_ephemeris_by_name_jdstep():
         abort(400)
 
     tle = get_tle(
-        parameters["name"], False, parameters["data_source"], jd[0].to_datetime()
+        parameters["name"], False, parameters["data_source"], jd_to_datetime(jd0)
     )
-    return propagate_and_create_json_results(
+    results = propagate_and_create_json_results(
         parameters["location"],
         jd,
         tle[0].tle_line1,
@@ -247,12 +338,11 @@ def get_ephemeris_by_name_jdstep():
         tle[1].sat_number,
         parameters["data_source"],
     )
+    return json_response(results)
 
 
 @app.route("/ephemeris/catalog-number/")
-@limiter.limit(
-    "100 per second, 2000 per minute", key_func=lambda: get_forwarded_address(request)
-)
+@limiter.limit("100 per second, 2000 per minute", key_func=forwarded_address_key)
 def get_ephemeris_by_catalog_number():
     """Returns satellite location and velocity information relative to the observer's
     coordinates for the given satellite's catalog number using the Two Line Element
@@ -287,37 +377,23 @@ def get_ephemeris_by_catalog_number():
     response: 'dictionary'
         JSON output with satellite information - see json_output() for format
     """
-    parameters = extract_parameters(
-        request,
-        [
-            "catalog",
-            "latitude",
-            "longitude",
-            "elevation",
-            "julian_date",
-            "min_altitude",
-            "max_altitude",
-            "data_source",
-        ],
-    )
+    parameters = extract_parameters(request, CATALOG_PARAMETERS)
 
-    parameters = validate_parameters(
-        parameters, ["catalog", "latitude", "longitude", "elevation", "julian_date"]
-    )
+    parameters = validate_parameters(parameters, CATALOG_REQUIRED)
 
-    # Converting string to list
+    # Test JD format
     try:
-        jd = Time(parameters["julian_date"], format="jd", scale="ut1")
-    except Exception:
+        jd = float(parameters["julian_date"])
+    except ValueError:
         abort(500, error_messages.INVALID_JD)
 
     tle = get_tle(
-        parameters["catalog"], True, parameters["data_source"], jd.to_datetime()
+        parameters["catalog"], True, parameters["data_source"], jd_to_datetime(jd)
     )
 
-    return propagate_and_create_json_results(
+    results = propagate_and_create_json_results(
         parameters["location"],
-        [jd],
+        jd,
         tle[0].tle_line1,
         tle[0].tle_line2,
         tle[0].date_collected,
@@ -327,12 +403,11 @@ def get_ephemeris_by_catalog_number():
         tle[1].sat_number,
         parameters["data_source"],
     )
+    return json_response(results)
 
 
 @app.route("/ephemeris/catalog-number-jdstep/")
-@limiter.limit(
-    "100 per second, 2000 per minute", key_func=lambda: get_forwarded_address(request)
-)
+@limiter.limit("100 per second, 2000 per minute", key_func=forwarded_address_key)
 def get_ephemeris_by_catalog_number_jdstep():
     """Returns satellite location and velocity information relative to the observer's
     coordinates for the given satellite's catalog number with the Two Line Element Data
@@ -371,26 +446,9 @@ def get_ephemeris_by_catalog_number_jdstep():
     response: 'dictionary'
         JSON output with satellite information - see json_output() for format
     """
-    parameters = extract_parameters(
-        request,
-        [
-            "catalog",
-            "latitude",
-            "longitude",
-            "elevation",
-            "startjd",
-            "stopjd",
-            "stepjd",
-            "min_altitude",
-            "max_altitude",
-            "data_source",
-        ],
-    )
+    parameters = extract_parameters(request, CATALOG_JDSTEP_PARAMETERS)
 
-    parameters = validate_parameters(
-        parameters,
-        ["catalog", "latitude", "longitude", "elevation", "startjd", "stopjd"],
-    )
+    parameters = validate_parameters(parameters, CATALOG_JDSTEP_REQUIRED)
 
     jd0 = float(parameters["startjd"])
     jd1 = float(parameters["stopjd"])
@@ -405,9 +463,9 @@ def get_ephemeris_by_catalog_number_jdstep():
         abort(400)
 
     tle = get_tle(
-        parameters["catalog"], True, parameters["data_source"], jd[0].to_datetime()
+        parameters["catalog"], True, parameters["data_source"], jd_to_datetime(jd0)
     )
-    return propagate_and_create_json_results(
+    results = propagate_and_create_json_results(
         parameters["location"],
         jd,
         tle[0].tle_line1,
@@ -419,12 +477,11 @@ def get_ephemeris_by_catalog_number_jdstep():
         tle[1].sat_number,
         parameters["data_source"],
     )
+    return json_response(results)
 
 
 @app.route("/ephemeris/tle/")
-@limiter.limit(
-    "100 per second, 2000 per minute", key_func=lambda: get_forwarded_address(request)
-)
+@limiter.limit("100 per second, 2000 per minute", key_func=forwarded_address_key)
 def get_ephemeris_by_tle():
     """Returns satellite location and velocity information relative to the observer's
     coordinates for a given Two Line Element Data Set at the specified Julian Date.
@@ -457,33 +514,20 @@ def get_ephemeris_by_tle():
         JSON output with satellite information - see json_output() for format
     """
 
-    parameters = extract_parameters(
-        request,
-        [
-            "tle",
-            "latitude",
-            "longitude",
-            "elevation",
-            "julian_date",
-            "min_altitude",
-            "max_altitude",
-        ],
-    )
+    parameters = extract_parameters(request, TLE_PARAMETERS)
 
-    parameters = validate_parameters(
-        parameters, ["tle", "latitude", "longitude", "elevation", "julian_date"]
-    )
+    parameters = validate_parameters(parameters, TLE_REQUIRED)
 
-    # Converting string to list
+    # Test JD format
     try:
-        jd = Time(parameters["julian_date"], format="jd", scale="ut1")
-    except Exception:
+        jd = float(parameters["julian_date"])
+    except ValueError:
         abort(500, error_messages.INVALID_JD)
 
     tle = parse_tle(parameters["tle"])
-    return propagate_and_create_json_results(
+    results = propagate_and_create_json_results(
         parameters["location"],
-        [jd],
+        jd,
         tle.tle_line1,
         tle.tle_line2,
         tle.date_collected,
@@ -493,12 +537,11 @@ def get_ephemeris_by_tle():
         tle.catalog,
         "user",
     )
+    return json_response(results)
 
 
 @app.route("/ephemeris/tle-jdstep/")
-@limiter.limit(
-    "100 per second, 2000 per minute", key_func=lambda: get_forwarded_address(request)
-)
+@limiter.limit("100 per second, 2000 per minute", key_func=forwarded_address_key)
 def get_ephemeris_by_tle_jdstep():
     """Returns satellite location and velocity information relative to the observer's
     coordinates for the given satellite's catalog number using the Two Line Element
@@ -535,24 +578,9 @@ def get_ephemeris_by_tle_jdstep():
     response: 'dictionary'
         JSON output with satellite information - see json_output() for format
     """
-    parameters = extract_parameters(
-        request,
-        [
-            "tle",
-            "latitude",
-            "longitude",
-            "elevation",
-            "startjd",
-            "stopjd",
-            "stepjd",
-            "min_altitude",
-            "max_altitude",
-        ],
-    )
+    parameters = extract_parameters(request, TLE_JDSTEP_PARAMETERS)
 
-    parameters = validate_parameters(
-        parameters, ["tle", "latitude", "longitude", "elevation", "startjd", "stopjd"]
-    )
+    parameters = validate_parameters(parameters, TLE_JDSTEP_REQUIRED)
 
     jd0 = float(parameters["startjd"])
     jd1 = float(parameters["stopjd"])
@@ -567,7 +595,7 @@ def get_ephemeris_by_tle_jdstep():
         abort(400)
 
     tle = parse_tle(parameters["tle"])
-    return propagate_and_create_json_results(
+    results = propagate_and_create_json_results(
         parameters["location"],
         jd,
         tle.tle_line1,
@@ -579,12 +607,11 @@ def get_ephemeris_by_tle_jdstep():
         tle.catalog,
         "user",
     )
+    return json_response(results)
 
 
 @app.route("/tools/norad-ids-from-name/")
-@limiter.limit(
-    "100 per second, 2000 per minute", key_func=lambda: get_forwarded_address(request)
-)
+@limiter.limit("100 per second, 2000 per minute", key_func=forwarded_address_key)
 def get_norad_ids_from_name():
     """
     Returns the NORAD ID(s) for a given satellite name.
@@ -599,10 +626,11 @@ def get_norad_ids_from_name():
     response: 'list'
         A list of NORAD IDs associated with the given satellite name.
     """
-    satellite_name = request.args.get("name").upper()
+    satellite_name = request.args.get("name")
 
     if satellite_name is None:
         abort(400)
+    satellite_name = satellite_name.upper()
 
     try:
         norad_ids_and_dates = get_ids_for_satelltite_name(satellite_name)
@@ -612,21 +640,19 @@ def get_norad_ids_from_name():
             {
                 "name": satellite_name,
                 "norad_id": id_date[0],
-                "date_added": id_date[1].strftime("%Y-%m-%d %H:%M:%S %Z"),
+                "date_added": format_date(id_date[1]),
             }
             for id_date in norad_ids_and_dates
         ]
 
-        return jsonify(norad_ids_and_dates)
-    except Exception as e:
+        return json_response(norad_ids_and_dates)
+    except SQLAlchemyError as e:
         app.logger.error(e)
-        return None
+        abort(503, "Error: Database unavailable, please try again later")
 
 
 @app.route("/tools/names-from-norad-id/")
-@limiter.limit(
-    "100 per second, 2000 per minute", key_func=lambda: get_forwarded_address(request)
-)
+@limiter.limit("100 per second, 2000 per minute", key_func=forwarded_address_key)
 def get_names_from_norad_id():
     """
     Retrieves any satellite names associated with a NORAD ID.
@@ -635,10 +661,10 @@ def get_names_from_norad_id():
     which is retrieved from the request arguments. The names of the matching satellites
     are then returned in a JSON format.
 
-    If an error occurs during the process, the error is logged and None is returned.
+    If the database is unavailable, the error is logged and a 503 is returned.
 
     Returns:
-        list: A list of satellite names in JSON format, or None if an error occurs.
+        list: A list of satellite names in JSON format.
     """
     satellite_id = request.args.get("id")
     if satellite_id is None:
@@ -652,26 +678,23 @@ def get_names_from_norad_id():
             {
                 "name": name_date[0],
                 "norad_id": satellite_id,
-                "date_added": name_date[1].strftime("%Y-%m-%d %H:%M:%S %Z"),
+                "date_added": format_date(name_date[1]),
             }
             for name_date in satellite_names_and_dates
         ]
 
-        for name, date_added in satellite_names_and_dates:
-            # Convert date_added to UTC before printing it
-            date_added_utc = date_added.astimezone(timezone.utc)
-            print(name, date_added_utc)
+        app.logger.debug(
+            "returned %d names for norad id %s", len(names_and_dates), satellite_id
+        )
 
-        return jsonify(names_and_dates)
-    except Exception as e:
+        return json_response(names_and_dates)
+    except SQLAlchemyError as e:
         app.logger.error(e)
-        return None
+        abort(503, "Error: Database unavailable, please try again later")
 
 
 @app.route("/tools/get-tle-data/")
-@limiter.limit(
-    "100 per second, 2000 per minute", key_func=lambda: get_forwarded_address(request)
-)
+@limiter.limit("100 per second, 2000 per minute", key_func=forwarded_address_key)
 def get_tle_data():
     satellite_id = request.args.get("id")
     id_type = request.args.get("id_type")
@@ -684,38 +707,45 @@ def get_tle_data():
     if id_type != "catalog" and id_type != "name":
         abort(400)
 
-    start_date = (
-        Time(start_date, format="jd", scale="ut1")
-        .to_datetime()
-        .replace(tzinfo=timezone.utc)
-        if start_date
-        else None
-    )
-    end_date = (
-        Time(end_date, format="jd", scale="ut1")
-        .to_datetime()
-        .replace(tzinfo=timezone.utc)
-        if end_date
-        else None
-    )
+    try:
+        start_date = (
+            jd_to_datetime(float(start_date)).replace(tzinfo=timezone.utc)
+            if start_date
+            else None
+        )
+        end_date = (
+            jd_to_datetime(float(end_date)).replace(tzinfo=timezone.utc)
+            if end_date
+            else None
+        )
+    except ValueError:
+        abort(500, error_messages.INVALID_JD)
 
     try:
         tle_data = get_tles(satellite_id, id_type, start_date, end_date)
 
-        # Extract the TLE data from the result set
+        # Extract the TLE data from the result set; unpacking the rows as
+        # plain column tuples skips a named-attribute lookup per field
         tle_data = [
             {
-                "satellite_name": tle.tle_satellite.sat_name,
-                "satellite_id": tle.tle_satellite.sat_number,
-                "tle_line1": tle.tle_line1,
-                "tle_line2": tle.tle_line2,
-                "epoch": tle.epoch.strftime("%Y-%m-%d %H:%M:%S %Z"),
-                "date_collected": tle.date_collected.strftime("%Y-%m-%d %H:%M:%S %Z"),
+                "satellite_name": sat_name,
+                "satellite_id": sat_number,
+                "tle_line1": tle_line1,
+                "tle_line2": tle_line2,
+                "epoch": format_date(epoch),
+                "date_collected": format_date(date_collected),
             }
-            for tle in tle_data
+            for (
+                sat_name,
+                sat_number,
+                tle_line1,
+                tle_line2,
+                epoch,
+                date_collected,
+            ) in tle_data
         ]
 
-        return jsonify(tle_data)
+        return json_response(tle_data)
 
     except Exception as e:
         if isinstance(e, DataError):
@@ -1,12 +1,14 @@
+import functools
 import json
 import os
 from collections import namedtuple
+from datetime import datetime, timedelta
 
 import astropy.units as u
 import boto3
 import numpy as np
 from astropy.coordinates import EarthLocation
-from astropy.time import Time, TimeDelta
+from astropy.time import Time
 from flask import abort
 from flask_limiter.util import get_remote_address
 from skyfield.api import EarthSatellite, load, wgs84
@@ -15,6 +17,25 @@ INVALID_JD = "Error: Invalid Julian Date"
 INVALID_PARAMETER = "Error: Invalid parameter format"
 NO_TLE_FOUND = "Error: No TLE found"
 
+# Result type for the propagator; created once instead of per epoch
+satellite_position = namedtuple(
+    "satellite_position",
+    [
+        "ra",
+        "dec",
+        "dracosdec",
+        "ddec",
+        "alt",
+        "az",
+        "distance",
+        "ddistance",
+        "phase_angle",
+        "illuminated",
+        "satellite_gcrs",
+        "observer_gcrs",
+    ],
+)
+
 
 def get_forwarded_address(request):
     forwarded_header = request.headers.get("X-Forwarded-For")
@@ -80,6 +101,78 @@ def get_db_login():
     return [username, password, host, port, dbname]
 
 
+def jd_to_datetime(jd):
+    """Convert a Julian Date to a naive datetime.
+
+    Constructing an astropy Time object just to call to_datetime() pays
+    ERFA-backed initialization overhead on every request; plain timedelta
+    arithmetic from the MJD epoch gives the same answer for the sub-second
+    precision needed to pick the closest TLE.
+
+    Parameters
+    ----------
+    jd: 'float'
+        Julian Date to convert
+
+    Returns
+    -------
+    date: 'datetime'
+        the corresponding (timezone-naive) datetime
+    """
+    return datetime(1858, 11, 17) + timedelta(days=jd - 2400000.5)
+
+
+def format_date(date):
+    """Format a UTC datetime as 'YYYY-MM-DD HH:MM:SS UTC'.
+
+    Equivalent to strftime("%Y-%m-%d %H:%M:%S %Z") for the timezone-aware
+    UTC values stored in the database, but skips the locale-aware strftime
+    machinery, which dominates row serialization on large result sets.
+
+    Parameters
+    ----------
+    date: 'datetime'
+        the date to format
+
+    Returns
+    -------
+    date_string: 'str'
+        the formatted date
+    """
+    return (
+        f"{date.year:04d}-{date.month:02d}-{date.day:02d} "
+        f"{date.hour:02d}:{date.minute:02d}:{date.second:02d} UTC"
+    )
+
+
+@functools.lru_cache(maxsize=None)
+def load_timescale():
+    """Load the Skyfield timescale once per process.
+
+    Building a timescale reads the IERS data files from disk on every call;
+    caching it means the cost is paid once per worker instead of once per
+    propagation.
+
+    Returns:
+    skyfield.timelib.Timescale: The shared timescale object.
+    """
+    return load.timescale()
+
+
+@functools.lru_cache(maxsize=None)
+def load_ephemeris():
+    """Load the JPL ephemeris once per process.
+
+    The de430t.bsp file is large and opening it per propagation call dominates
+    the per-request latency; the cached object is reused by every request
+    served by this worker.
+
+    Returns:
+    skyfield.jpllib.SpiceKernel: The shared ephemeris kernel.
+    """
+    return load("de430t.bsp")
+
+
 def tle_to_icrf_state(tle_line_1, tle_line_2, jd):
     """
     Converts Two-Line Element (TLE) set to International Celestial Reference Frame
@@ -99,7 +192,7 @@ def tle_to_icrf_state(tle_line_1, tle_line_2, jd):
     the satellite.
     """
     # This is the skyfield implementation
-    ts = load.timescale()
+    ts = load_timescale()
     satellite = EarthSatellite(tle_line_1, tle_line_2, ts=ts)
 
     # Set time to satellite epoch if input jd is 0, otherwise time is inputted jd
@@ -270,15 +363,11 @@ def jd_arange(a, b, dr, decimals=11):
     res: 'numpy array of floats'
         array of numbers between a and b with dr increments
     """
-    res = [a]
-    k = 1
-    while res[-1] < b:
-        tmp = np.round(a + k * dr, decimals)
-        if tmp > b:
-            break
-        res.append(tmp)
-        k += 1
-    dates = np.asarray(res)
+    # build the whole grid in one numpy pass; the mask trims any round-off
+    # overshoot past b, matching the old element-by-element loop
+    k = np.arange(1, int((b - a) / dr) + 2)
+    tail = np.round(a + k * dr, decimals)
+    dates = np.concatenate(([a], tail[tail <= b]))
 
     try:
         results = Time(dates, format="jd", scale="ut1")
@@ -412,34 +501,80 @@ def propagate_satellite(tle_line_1, tle_line_2, location, jd, dtsec=1):
     distance: 'float'
         Range from observer to object in km
     """
-    # This is the skyfield implementation
-    ts = load.timescale()
+    return next(
+        iter(propagate_satellite_batch(tle_line_1, tle_line_2, location, [jd.jd]))
+    )
+
+
+def propagate_satellite_batch(tle_line_1, tle_line_2, location, jd_values, dtsec=1):
+    """Propagate one satellite/observer pair over a whole array of Julian Dates.
+
+    The Skyfield satellite, observer, and topocentric difference objects are
+    built once and reused for every epoch, so a jdstep request with up to 1000
+    dates only pays the construction cost a single time.
+
+    Parameters
+    ----------
+    tle_line_1: 'str'
+        TLE line 1
+    tle_line_2: 'str'
+        TLE line 2
+    location: 'EarthLocation'
+        The observer location
+    jd_values: 'iterable of floats'
+        UT1 Universal Time Julian Dates. An input of 0 will use the TLE epoch.
+    dtsec: 'float'
+        Time step in seconds used for the finite-difference rates
+
+    Yields
+    ------
+    satellite_position: 'namedtuple'
+        The satellite position relative to the observer at each requested date,
+        in the order the dates were given - see propagate_satellite() for the
+        individual fields
+    """
+    ts = load_timescale()
     satellite = EarthSatellite(tle_line_1, tle_line_2, ts=ts)
 
     # Get current position and find topocentric ra and dec
     curr_pos = wgs84.latlon(
         location.lat.value, location.lon.value, location.height.value
     )
+    difference = satellite - curr_pos
+
+    # everything that does not depend on the epoch is computed once here and
+    # passed into the per-epoch kernel
+    eph = load_ephemeris()
+    earth = eph["Earth"]
+    sun = eph["Sun"]
+    dtdays = dtsec / 86400.0
+    dtx2 = 2 * dtsec
+
+    for jd in jd_values:
+        yield _propagate_satellite_position(
+            ts, satellite, curr_pos, difference, earth, sun, jd, dtdays, dtx2
+        )
+
+
+def _propagate_satellite_position(
+    ts, satellite, curr_pos, difference, earth, sun, jd, dtdays, dtx2
+):
     # Set time to satellite epoch if input jd is 0, otherwise time is inputted jd
     # Use ts.ut1_jd instead of ts.from_astropy because from_astropy uses
     # astropy.Time.TT.jd instead of UT1
-    if jd.jd == 0:
+    if jd == 0:
         t = ts.ut1_jd(satellite.model.jdsatepoch)
     else:
-        t = ts.ut1_jd(jd.jd)
+        t = ts.ut1_jd(jd)
 
-    difference = satellite - curr_pos
     topocentric = difference.at(t)
     topocentricn = topocentric.position.km / np.linalg.norm(topocentric.position.km)
 
     ra, dec, distance = topocentric.radec()
     alt, az, distance = topocentric.altaz()
 
-    dtday = TimeDelta(1, format="sec")
-    tplusdt = ts.ut1_jd((jd + dtday).jd)
-    tminusdt = ts.ut1_jd((jd - dtday).jd)
-
-    dtx2 = 2 * dtsec
+    tplusdt = ts.ut1_jd(jd + dtdays)
+    tminusdt = ts.ut1_jd(jd - dtdays)
 
     sat_gcrs = satellite.at(t).position.km
 
@@ -472,10 +607,6 @@ def propagate_satellite(tle_line_1, tle_line_2, location, jd, dtsec=1):
     # drav, ddecv = icrf2radec(vsattop / sattopr, unit_vector=True)
     # dracosdecv = drav * np.cos(dec.radians)
 
-    eph = load("de430t.bsp")
-    earth = eph["Earth"]
-    sun = eph["Sun"]
-
     earthp = earth.at(t).position.km
     sunp = sun.at(t).position.km
     earthsun = sunp - earthp
@@ -499,23 +630,6 @@ def propagate_satellite(tle_line_1, tle_line_2, location, jd, dtsec=1):
             # yes the satellite is in Earth's shadow, no need to continue
             # (except for the moon of course)
             illuminated = False
-    satellite_position = namedtuple(
-        "satellite_position",
-        [
-            "ra",
-            "dec",
-            "dracosdec",
-            "ddec",
-            "alt",
-            "az",
-            "distance",
-            "ddistance",
-            "phase_angle",
-            "illuminated",
-            "satellite_gcrs",
-            "observer_gcrs",
-        ],
-    )
     return satellite_position(
         ra,
         dec,
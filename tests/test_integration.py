@@ -1,835 +1,412 @@
 # ruff: noqa: S101
 
-import pytest
-import requests
-
-assert_precision = 0.0000000001
-
-
-def test_get_ephemeris_by_name(client):
-    # correct request
-    response = requests.get(
-        "https://cps.iau.org/tools/satchecker/api/ephemeris/name/?name=ISS%20(ZARYA)&elevation=150&latitude=32&longitude=-110&julian_date=2460193.104167",
-        timeout=10,
-    )
-    # Check that the response was returned without error
-    assert response.status_code == 200
-
-    # elevation missing
-    response = requests.get(
-        "https://cps.iau.org/tools/satchecker/api/ephemeris/name/?name=ISS%20(ZARYA)&latitude=32&longitude=-110&julian_date=2460193.104167",
-        timeout=10,
-    )
-    # Check that the response has the correct status code
-    assert response.status_code == 400
-    # Check that the response contains the expected error message.
-    assert "Incorrect parameters" in response.text, "Incorrect error message returned"
+import os
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from urllib.parse import urlencode
 
-    # name missing
-    response = requests.get(
-        "https://cps.iau.org/tools/satchecker/api/ephemeris/name/?elevation=150&latitude=32&longitude=-110&julian_date=2460193.104167",
-        timeout=10,
-    )
-    # Check that the response was returned without error
-    assert response.status_code == 400
-    # Check that the response contains the expected error message.
-    assert "Incorrect parameters" in response.text, "Incorrect error message returned"
-
-    # latitude missing
-    response = requests.get(
-        "https://cps.iau.org/tools/satchecker/api/ephemeris/name/?name=ISS%20(ZARYA)&elevation=150&longitude=-110&julian_date=2460193.104167",
-        timeout=10,
-    )
-    # Check that the response was returned without error
-    assert response.status_code == 400
-
-    # Check that the response contains the expected error message.
-    assert "Incorrect parameters" in response.text, "Incorrect error message returned"
-
-    # longitude missing
-    response = requests.get(
-        "https://cps.iau.org/tools/satchecker/api/ephemeris/name/?name=ISS%20(ZARYA)&elevation=150&latitude=32&julian_date=2460193.104167",
-        timeout=10,
-    )
-    # Check that the response was returned without error
-    assert response.status_code == 400
-    # Check that the response contains the expected error message.
-    assert "Incorrect parameters" in response.text, "Incorrect error message returned"
-
-    # julian_date missing
-    response = requests.get(
-        "https://cps.iau.org/tools/satchecker/api/ephemeris/name/?name=ISS%20(ZARYA)&elevation=150&latitude=32&longitude=-110",
-        timeout=10,
-    )
-    # Check that the response was returned without error
-    assert response.status_code == 400
-    # Check that the response contains the expected error message.
-    assert "Incorrect parameters" in response.text, "Incorrect error message returned"
-
-    # with min_altitude
-    response = requests.get(
-        "https://cps.iau.org/tools/satchecker/api/ephemeris/name/?name=ISS%20(ZARYA)&elevation=150&latitude=32&longitude=-110&julian_date=2460193.104167&min_altitude=-90",
-        timeout=10,
-    )
-    # Check that the response was returned without error
-    assert response.status_code == 200
-
-    # with max altitude
-    response = requests.get(
-        "https://cps.iau.org/tools/satchecker/api/ephemeris/name/?name=ISS%20(ZARYA)&elevation=150&latitude=32&longitude=-110&julian_date=2460193.104167&max_altitude=80",
-        timeout=10,
-    )
-    # Check that the response was returned without error
-    assert response.status_code == 200
-
-    # with min and max altitude
-    response = requests.get(
-        "https://cps.iau.org/tools/satchecker/api/ephemeris/name/?name=ISS%20(ZARYA)&elevation=150&latitude=32&longitude=-110&julian_date=2460193.104167&min_altitude=-90&max_altitude=80",
-        timeout=10,
-    )
-    # Check that the response was returned without error
-    assert response.status_code == 200
-
-    # with data_source (both)
-    response = requests.get(
-        "https://cps.iau.org/tools/satchecker/api/ephemeris/name/?name=ISS%20(ZARYA)&elevation=150&latitude=32&longitude=-110&julian_date=2460193.104167&min_altitude=-90&data_source=celestrak",
-        timeout=10,
-    )
-    # Check that the response was returned without error
-    assert response.status_code == 200
-
-    response = requests.get(
-        "https://cps.iau.org/tools/satchecker/api/ephemeris/name/?name=ISS%20(ZARYA)&elevation=150&latitude=32&longitude=-110&julian_date=2460193.104167&min_altitude=-90&data_source=spacetrack",
-        timeout=10,
-    )
-    # Check that the response was returned without error
-    assert response.status_code == 200
-
-    # verify response data
-    response = requests.get(
-        "https://cps.iau.org/tools/satchecker/api/ephemeris/name/?name=ISS%20(ZARYA)&elevation=150&latitude=32&longitude=-110&julian_date=2460193.104167&min_altitude=-90&max_altitude=80",
-        timeout=10,
-    )
-    data = response.json()
-    assert_precision = 0.0000001
-    assert data[0]["ALTITUDE-DEG"] == pytest.approx(-73.95450985559, assert_precision)
-    assert data[0]["AZIMUTH-DEG"] == pytest.approx(337.1315771994, assert_precision)
-    assert data[0]["CATALOG_ID"] == 25544
-    assert data[0]["DATA_SOURCE"] == "spacetrack"
-    assert data[0]["DDEC-DEG_PER_SEC"] == pytest.approx(0.02567256817, assert_precision)
-    assert data[0]["DECLINATION-DEG"] == pytest.approx(
-        -17.07188637651, assert_precision
-    )
-    assert data[0]["DRA_COSDEC-DEG_PER_SEC"] == pytest.approx(
-        0.02330719137, assert_precision
-    )
-    assert data[0]["ILLUMINATED"] is True
-    assert data[0]["JULIAN_DATE"] == pytest.approx(2460193.104167, assert_precision)
-    assert data[0]["NAME"] == "ISS (ZARYA)"
-    assert data[0]["OBSERVER_GCRS_KM"] == [
-        pytest.approx(-147.12272716510805, assert_precision),
-        pytest.approx(5412.091101268944, assert_precision),
-        pytest.approx(3360.663968123699, assert_precision),
-    ]
-    assert data[0]["PHASE_ANGLE-DEG"] == pytest.approx(64.8724036003, assert_precision)
-    assert data[0]["RANGE-KM"] == pytest.approx(12711.581551491206, assert_precision)
-
-    assert data[0]["RANGE_RATE-KM_PER_SEC"] == pytest.approx(
-        -1.821548659271, assert_precision
-    )
-    assert data[0]["RIGHT_ASCENSION-DEG"] == pytest.approx(
-        278.04965785823, assert_precision
-    )
-    assert data[0]["SATELLITE_GCRS_KM"] == [
-        pytest.approx(1554.4639759227455, assert_precision),
-        pytest.approx(-6619.6547574595015, assert_precision),
-        pytest.approx(-371.09162717694767, assert_precision),
-    ]
-    assert data[0]["TLE-DATE"] == "2024-03-08 00:35:51"
-
-
-def test_get_ephemeris_by_catalog_number(client):
-    # correct request
-    response = requests.get(
-        "https://cps.iau.org/tools/satchecker/api/ephemeris/catalog-number/?catalog=25544&elevation=150&latitude=32&longitude=-110&julian_date=2460193.104167",
-        timeout=10,
-    )
-    # Check that the response was returned without error
-    assert response.status_code == 200
-
-    # elevation missing
-    response = requests.get(
-        "https://cps.iau.org/tools/satchecker/api/ephemeris/catalog-number/?catalog=25544&latitude=32&longitude=-110&julian_date=2460193.104167",
-        timeout=10,
-    )
-    # Check that the response has the correct status code
-    assert response.status_code == 400
-    # Check that the response contains the expected error message.
-    assert "Incorrect parameters" in response.text, "Incorrect error message returned"
-
-    # catalog number missing
-    response = requests.get(
-        "https://cps.iau.org/tools/satchecker/api/ephemeris/catalog-number/?elevation=150&latitude=32&longitude=-110&julian_date=2460193.104167",
-        timeout=10,
-    )
-    # Check that the response was returned without error
-    assert response.status_code == 400
-    # Check that the response contains the expected error message.
-    assert "Incorrect parameters" in response.text, "Incorrect error message returned"
-
-    # latitude missing
-    response = requests.get(
-        "https://cps.iau.org/tools/satchecker/api/ephemeris/catalog-number/?catalog=25544&elevation=150&longitude=-110&julian_date=2460193.104167",
-        timeout=10,
-    )
-    # Check that the response was returned without error
-    assert response.status_code == 400
-    # Check that the response contains the expected error message.
-    assert "Incorrect parameters" in response.text, "Incorrect error message returned"
-
-    # longitude missing
-    response = requests.get(
-        "https://cps.iau.org/tools/satchecker/api/ephemeris/catalog-number/?catalog=25544&elevation=150&latitude=32&julian_date=2460193.104167",
-        timeout=10,
-    )
-    # Check that the response was returned without error
-    assert response.status_code == 400
-    # Check that the response contains the expected error message.
-    assert "Incorrect parameters" in response.text, "Incorrect error message returned"
-
-    # julian_date missing
-    response = requests.get(
-        "https://cps.iau.org/tools/satchecker/api/ephemeris/catalog-number/?catalog=25544&elevation=150&latitude=32&longitude=-110",
-        timeout=10,
-    )
-    # Check that the response was returned without error
-    assert response.status_code == 400
-    # Check that the response contains the expected error message.
-    assert "Incorrect parameters" in response.text, "Incorrect error message returned"
-
-    # with min_altitude
-    response = requests.get(
-        "https://cps.iau.org/tools/satchecker/api/ephemeris/catalog-number/?catalog=25544&elevation=150&latitude=32&longitude=-110&julian_date=2460193.104167&min_altitude=-90",
-        timeout=10,
-    )
-    # Check that the response was returned without error
-    assert response.status_code == 200
-
-    # with max altitude
-    response = requests.get(
-        "https://cps.iau.org/tools/satchecker/api/ephemeris/catalog-number/?catalog=25544&elevation=150&latitude=32&longitude=-110&julian_date=2460193.104167&max_altitude=80",
-        timeout=10,
-    )
-    # Check that the response was returned without error
-    assert response.status_code == 200
-
-    # with min and max altitude
-    response = requests.get(
-        "https://cps.iau.org/tools/satchecker/api/ephemeris/catalog-number/?catalog=25544&elevation=150&latitude=32&longitude=-110&julian_date=2460193.104167&min_altitude=-90&max_altitude=80",
-        timeout=10,
-    )
-    # Check that the response was returned without error
-    assert response.status_code == 200
-
-    # with data_source (both)
-    response = requests.get(
-        "https://cps.iau.org/tools/satchecker/api/ephemeris/catalog-number/?catalog=25544&elevation=150&latitude=32&longitude=-110&julian_date=2460193.104167&min_altitude=-90&data_source=celestrak",
-        timeout=10,
-    )
-    # Check that the response was returned without error
-    assert response.status_code == 200
-
-    response = requests.get(
-        "https://cps.iau.org/tools/satchecker/api/ephemeris/catalog-number/?catalog=25544&elevation=150&latitude=32&longitude=-110&julian_date=2460193.104167&min_altitude=-90&data_source=spacetrack",
-        timeout=10,
-    )
-    # Check that the response was returned without error
-    assert response.status_code == 200
-
-
-def test_get_ephemeris_by_name_jdstep(client):
-    # correct request
-    response = requests.get(
-        "https://cps.iau.org/tools/satchecker/api/ephemeris/name-jdstep/?name=ISS%20(ZARYA)&elevation=150&latitude=32&longitude=-110&startjd=2460193.104167&stopjd=2460194.104167&stepjd=0.1",
-        timeout=10,
-    )
-    # Check that the response was returned without error
-    assert response.status_code == 200
-
-    # elevation missing
-    response = requests.get(
-        "https://cps.iau.org/tools/satchecker/api/ephemeris/name-jdstep/?name=ISS%20(ZARYA)&latitude=32&longitude=-110&startjd=2460193.104167&stopjd=2460194.104167&stepjd=0.1",
-        timeout=10,
-    )
-    # Check that the response has the correct status code
-    assert response.status_code == 400
-    # Check that the response contains the expected error message.
-    assert "Incorrect parameters" in response.text, "Incorrect error message returned"
-
-    # name missing
-    response = requests.get(
-        "https://cps.iau.org/tools/satchecker/api/ephemeris/name-jdstep/?elevation=150&latitude=32&longitude=-110&startjd=2460193.104167&stopjd=2460194.104167&stepjd=0.1",
-        timeout=10,
-    )
-    # Check that the response was returned with correct error
-    assert response.status_code == 400
-    # Check that the response contains the expected error message.
-    assert "Incorrect parameters" in response.text, "Incorrect error message returned"
-
-    # latitude missing
-    response = requests.get(
-        "https://cps.iau.org/tools/satchecker/api/ephemeris/name-jdstep/?name=ISS%20(ZARYA)&elevation=150&longitude=-110&startjd=2460193.104167&stopjd=2460194.104167&stepjd=0.1",
-        timeout=10,
-    )
-    # Check that the response was returned with correct error
-    assert response.status_code == 400
-    # Check that the response contains the expected error message.
-    assert "Incorrect parameters" in response.text, "Incorrect error message returned"
-
-    # longitude missing
-    response = requests.get(
-        "https://cps.iau.org/tools/satchecker/api/ephemeris/name-jdstep/?name=ISS%20(ZARYA)&elevation=150&latitude=32&startjd=2460193.104167&stopjd=2460194.104167&stepjd=0.1",
-        timeout=10,
-    )
-    # Check that the response was returned with correct error
-    assert response.status_code == 400
-    # Check that the response contains the expected error message.
-    assert "Incorrect parameters" in response.text, "Incorrect error message returned"
-
-    # startjd missing
-    response = requests.get(
-        "https://cps.iau.org/tools/satchecker/api/ephemeris/name-jdstep/?name=ISS%20(ZARYA)&elevation=150&latitude=32&longitude=-110&stopjd=2460194.104167&stepjd=0.1",
-        timeout=10,
-    )
-    # Check that the response was returned with correct error
-    assert response.status_code == 400
-    # Check that the response contains the expected error message.
-    assert "Incorrect parameters" in response.text, "Incorrect error message returned"
-
-    # stopjd missing
-    response = requests.get(
-        "https://cps.iau.org/tools/satchecker/api/ephemeris/name-jdstep/?name=ISS%20(ZARYA)&elevation=150&latitude=32&longitude=-110&startjd=2460193.104167&stepjd=0.1",
-        timeout=10,
-    )
-    # Check that the response was returned with correct error
-    assert response.status_code == 400
-    # Check that the response contains the expected error message.
-    assert "Incorrect parameters" in response.text, "Incorrect error message returned"
-
-    # with min_altitude
-    response = requests.get(
-        "https://cps.iau.org/tools/satchecker/api/ephemeris/name-jdstep/?name=ISS%20(ZARYA)&elevation=150&latitude=32&longitude=-110&&startjd=2460193.104167&stopjd=2460194.104167&stepjd=0.1&min_altitude=-90",
-        timeout=10,
-    )
-    # Check that the response was returned without error
-    assert response.status_code == 200
-
-    # with max altitude
-    response = requests.get(
-        "https://cps.iau.org/tools/satchecker/api/ephemeris/name-jdstep/?name=ISS%20(ZARYA)&elevation=150&latitude=32&longitude=-110&startjd=2460193.104167&stopjd=2460194.104167&stepjd=0.1&max_altitude=80",
-        timeout=10,
-    )
-    # Check that the response was returned without error
-    assert response.status_code == 200
-
-    # with min and max altitude
-    response = requests.get(
-        "https://cps.iau.org/tools/satchecker/api/ephemeris/name-jdstep/?name=ISS%20(ZARYA)&elevation=150&latitude=32&longitude=-110&startjd=2460193.104167&stopjd=2460194.104167&stepjd=0.1&min_altitude=-90&max_altitude=80",
-        timeout=10,
-    )
-    # Check that the response was returned without error
-    assert response.status_code == 200
+import pytest
 
-    # with data_source (both)
-    response = requests.get(
-        "https://cps.iau.org/tools/satchecker/api/ephemeris/name-jdstep/?name=ISS%20(ZARYA)&elevation=150&latitude=32&longitude=-110&startjd=2460193.104167&stopjd=2460194.104167&stepjd=0.1&min_altitude=-90&data_source=celestrak",
-        timeout=10,
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+pytestmark = pytest.mark.integration
+
+# relative tolerance for the numeric response comparisons
+REL_TOL = 1e-7
+
+BASE = "https://cps.iau.org/tools/satchecker/api/ephemeris"
+TOOLS_BASE = "https://cps.iau.org/tools/satchecker/api/tools"
+
+# (connect, read) timeout; a hung connect fails fast instead of holding a
+# test for the full read budget
+TIMEOUT = (2, 5)
+
+ISS_TLE = (
+    "ISS (ZARYA)\n"
+    "1 25544U 98067A   23248.54842295  .00012769  00000+0  22936-3 0  9997\n"
+    "2 25544  51.6416 290.4299 0005730  30.7454 132.9751 15.50238117414255"
+)
+
+# baseline query parameters for each ephemeris endpoint; the parametrized
+# tests below drop or override entries instead of repeating whole URLs
+EPHEMERIS_PARAMS = {
+    "name": {
+        "name": "ISS (ZARYA)",
+        "elevation": 150,
+        "latitude": 32,
+        "longitude": -110,
+        "julian_date": 2460193.104167,
+    },
+    "catalog-number": {
+        "catalog": 25544,
+        "elevation": 150,
+        "latitude": 32,
+        "longitude": -110,
+        "julian_date": 2460193.104167,
+    },
+    "name-jdstep": {
+        "name": "ISS (ZARYA)",
+        "elevation": 150,
+        "latitude": 32,
+        "longitude": -110,
+        "startjd": 2460193.104167,
+        "stopjd": 2460194.104167,
+        "stepjd": 0.1,
+    },
+    "catalog-number-jdstep": {
+        "catalog": 25544,
+        "elevation": 150,
+        "latitude": 32,
+        "longitude": -110,
+        "startjd": 2460193.104167,
+        "stopjd": 2460194.104167,
+        "stepjd": 0.1,
+    },
+    "tle": {
+        "tle": ISS_TLE,
+        "latitude": 40.1106,
+        "longitude": -88.2073,
+        "elevation": 222,
+        "julian_date": 2460000.1,
+    },
+    "tle-jdstep": {
+        "tle": ISS_TLE,
+        "latitude": 40.1106,
+        "longitude": -88.2073,
+        "elevation": 222,
+        "startjd": 2460000.1,
+        "stopjd": 2460000.3,
+        "stepjd": 0.1,
+    },
+}
+
+ENDPOINTS = list(EPHEMERIS_PARAMS)
+
+# (endpoint, parameter to drop); every missing parameter is a 400 except a
+# missing TLE, which the service reports as a 500 and is covered separately
+MISSING_PARAM_CASES = [
+    (endpoint, dropped)
+    for endpoint, params in EPHEMERIS_PARAMS.items()
+    for dropped in params
+    if dropped not in ("stepjd", "tle")
+]
+
+# malformed variants reuse the real name and line 2; only line 1 is truncated
+_ISS_NAME, _, _ISS_LINE2 = ISS_TLE.split("\n")
+MALFORMED_TLES = {
+    "tle": f"{_ISS_NAME}\n1 25544U 9812769  00000+0  22936-3 0  9997\n{_ISS_LINE2}",
+    "tle-jdstep": f"{_ISS_NAME}\n1 2554420 00000+0  22936-3 0  9997\n{_ISS_LINE2}",
+}
+
+ALTITUDE_FILTERS = [
+    {"min_altitude": -90},
+    {"max_altitude": 80},
+    {"min_altitude": -90, "max_altitude": 80},
+]
+
+# expected first row of the name-endpoint response, split into the fields
+# compared approximately and the ones compared exactly
+EXPECTED_EPHEMERIS_APPROX = {
+    "ALTITUDE-DEG": -73.95450985559,
+    "AZIMUTH-DEG": 337.1315771994,
+    "DDEC-DEG_PER_SEC": 0.02567256817,
+    "DECLINATION-DEG": -17.07188637651,
+    "DRA_COSDEC-DEG_PER_SEC": 0.02330719137,
+    "JULIAN_DATE": 2460193.104167,
+    "PHASE_ANGLE-DEG": 64.8724036003,
+    "RANGE-KM": 12711.581551491206,
+    "RANGE_RATE-KM_PER_SEC": -1.821548659271,
+    "RIGHT_ASCENSION-DEG": 278.04965785823,
+}
+
+# expected first row of the get-tle-data start-and-end-date lookup
+EXPECTED_TLE_ROW = {
+    "satellite_name": "ISS (ZARYA)",
+    "date_collected": "2024-04-26 01:31:05 UTC",
+    "epoch": "2024-04-25 18:22:37 UTC",
+    "satellite_id": 25544,
+    "tle_line1": (
+        "1 25544U 98067A   24116.76570894  .00062894  00000+0  10654-2 0  9996"
+    ),
+    "tle_line2": (
+        "2 25544  51.6396 215.3361 0004566  95.7745   7.6568 15.50926567450413"
+    ),
+}
+
+EXPECTED_EPHEMERIS_EXACT = {
+    "CATALOG_ID": 25544,
+    "DATA_SOURCE": "spacetrack",
+    "ILLUMINATED": True,
+    "NAME": "ISS (ZARYA)",
+    "TLE-DATE": "2024-03-08 00:35:51",
+}
+
+
+def parse_json(response):
+    """Decode a response body with orjson when available (it parses the
+    float-heavy ephemeris payloads several times faster than stdlib json)."""
+    if orjson is not None:
+        return orjson.loads(response.content)
+    return response.json()
+
+
+@lru_cache(maxsize=512)
+def _build_url(base, endpoint, query_items):
+    return f"{base}/{endpoint}/?{urlencode(query_items)}"
+
+
+def _query_items(endpoint, overrides):
+    params = {**EPHEMERIS_PARAMS[endpoint], **overrides}
+    return tuple((k, v) for k, v in params.items() if v is not None)
+
+
+def ephemeris_url(endpoint, **overrides):
+    """Build a live-API ephemeris URL from the endpoint's baseline parameters.
+
+    Keyword overrides replace baseline entries; passing None drops one.
+    Built URLs are memoized, so retries and repeat cases reuse the same
+    string instead of re-encoding it.
+    """
+    return _build_url(BASE, endpoint, _query_items(endpoint, overrides))
+
+
+def ephemeris_path(endpoint, **overrides):
+    """Same query as ephemeris_url, as an app-relative path for the
+    in-process Flask test client."""
+    return _build_url("/ephemeris", endpoint, _query_items(endpoint, overrides))
+
+
+def tools_url(endpoint, **params):
+    """Build a live-API tools URL, memoized like ephemeris_url."""
+    return _build_url(TOOLS_BASE, endpoint, tuple(params.items()))
+
+
+@pytest.fixture(scope="module")
+def validation_client(client, http):
+    """GET callable for validation-only cases.
+
+    Parameter validation lives entirely in the view's argument parsing, so
+    by default these cases run against the in-process Flask client with no
+    network at all; set SATCHECKER_LIVE=1 to exercise the production API
+    instead.
+    """
+    if os.environ.get("SATCHECKER_LIVE") == "1":
+        return lambda endpoint, **overrides: http.get(
+            ephemeris_url(endpoint, **overrides), timeout=TIMEOUT
+        )
+    return lambda endpoint, **overrides: client.get(
+        ephemeris_path(endpoint, **overrides)
+    )
+
+
+@pytest.fixture(scope="module")
+def prefetched(http):
+    """Every live 200-expectation response, fetched concurrently.
+
+    The whole matrix is independent GETs against one host, so fetching it
+    through a thread pool once per module costs roughly one round-trip
+    instead of one per test (and doubles as the upstream warmup).
+    """
+    urls = {ephemeris_url(endpoint) for endpoint in ENDPOINTS}
+    urls.update(
+        ephemeris_url(endpoint, **altitude)
+        for endpoint in ENDPOINTS
+        for altitude in ALTITUDE_FILTERS
     )
-    # Check that the response was returned without error
-    assert response.status_code == 200
-
-    response = requests.get(
-        "https://cps.iau.org/tools/satchecker/api/ephemeris/name-jdstep/?name=ISS%20(ZARYA)&elevation=150&latitude=32&longitude=-110&startjd=2460193.104167&stopjd=2460194.104167&stepjd=0.1&min_altitude=-90&data_source=spacetrack",
-        timeout=10,
+    urls.update(
+        ephemeris_url(endpoint, data_source=data_source)
+        for endpoint in ENDPOINTS
+        for data_source in ("celestrak", "spacetrack")
     )
-    # Check that the response was returned without error
-    assert response.status_code == 200
+    urls = sorted(urls)
+    with ThreadPoolExecutor(max_workers=16) as executor:
+        responses = list(executor.map(lambda u: http.get(u, timeout=TIMEOUT), urls))
+    return dict(zip(urls, responses))
 
 
-def test_get_ephemeris_by_catalog_jdstep(client):
-    # correct request
-    response = requests.get(
-        "https://cps.iau.org/tools/satchecker/api/ephemeris/catalog-number-jdstep/?catalog=25544&elevation=150&latitude=32&longitude=-110&startjd=2460193.104167&stopjd=2460194.104167&stepjd=0.1",
-        timeout=10,
-    )
+@pytest.mark.parametrize("endpoint", ENDPOINTS)
+def test_ephemeris_happy_path(prefetched, endpoint):
+    response = prefetched[ephemeris_url(endpoint)]
     # Check that the response was returned without error
     assert response.status_code == 200
 
-    # elevation missing
-    response = requests.get(
-        "https://cps.iau.org/tools/satchecker/api/ephemeris/catalog-number-jdstep/?catalog=25544&latitude=32&longitude=-110&startjd=2460193.104167&stopjd=2460194.104167&stepjd=0.1",
-        timeout=10,
-    )
-    # Check that the response has the correct status code
-    assert response.status_code == 400
-    # Check that the response contains the expected error message.
-    assert "Incorrect parameters" in response.text, "Incorrect error message returned"
 
-    # catalog id missing
-    response = requests.get(
-        "https://cps.iau.org/tools/satchecker/api/ephemeris/catalog-number-jdstep/?elevation=150&latitude=32&longitude=-110&startjd=2460193.104167&stopjd=2460194.104167&stepjd=0.1",
-        timeout=10,
-    )
-    # Check that the response was returned with correct error
-    assert response.status_code == 400
-    # Check that the response contains the expected error message.
-    assert "Incorrect parameters" in response.text, "Incorrect error message returned"
-
-    # latitude missing
-    response = requests.get(
-        "https://cps.iau.org/tools/satchecker/api/ephemeris/catalog-number-jdstep/?catalog=25544&elevation=150&longitude=-110&startjd=2460193.104167&stopjd=2460194.104167&stepjd=0.1",
-        timeout=10,
-    )
-    # Check that the response was returned with correct error
-    assert response.status_code == 400
-    # Check that the response contains the expected error message.
-    assert "Incorrect parameters" in response.text, "Incorrect error message returned"
-
-    # longitude missing
-    response = requests.get(
-        "https://cps.iau.org/tools/satchecker/api/ephemeris/catalog-number-jdstep/?catalog=25544&elevation=150&latitude=32&startjd=2460193.104167&stopjd=2460194.104167&stepjd=0.1",
-        timeout=10,
-    )
-    # Check that the response was returned with correct error
-    assert response.status_code == 400
-    # Check that the response contains the expected error message.
-    assert "Incorrect parameters" in response.text, "Incorrect error message returned"
-
-    # startjd missing
-    response = requests.get(
-        "https://cps.iau.org/tools/satchecker/api/ephemeris/catalog-number-jdstep/?catalog=25544&elevation=150&latitude=32&longitude=-110&stopjd=2460194.104167&stepjd=0.1",
-        timeout=10,
-    )
-    # Check that the response was returned with correct error
+@pytest.mark.parametrize("endpoint,dropped", MISSING_PARAM_CASES)
+def test_ephemeris_missing_param(validation_client, endpoint, dropped):
+    response = validation_client(endpoint, **{dropped: None})
+    # Check that the response was returned with the correct error
     assert response.status_code == 400
-    # Check that the response contains the expected error message.
     assert "Incorrect parameters" in response.text, "Incorrect error message returned"
 
-    # stopjd missing
-    response = requests.get(
-        "https://cps.iau.org/tools/satchecker/api/ephemeris/catalog-number-jdstep/?catalog=25544&elevation=150&latitude=32&longitude=-110&startjd=2460193.104167&stepjd=0.1",
-        timeout=10,
-    )
-    # Check that the response was returned with correct error
-    assert response.status_code == 400
-
-    # with min_altitude
-    response = requests.get(
-        "https://cps.iau.org/tools/satchecker/api/ephemeris/catalog-number-jdstep/?catalog=25544&elevation=150&latitude=32&longitude=-110&&startjd=2460193.104167&stopjd=2460194.104167&stepjd=0.1&min_altitude=-90",
-        timeout=10,
-    )
-    # Check that the response was returned without error
-    assert response.status_code == 200
-
-    # with max altitude
-    response = requests.get(
-        "https://cps.iau.org/tools/satchecker/api/ephemeris/catalog-number-jdstep/?catalog=25544&elevation=150&latitude=32&longitude=-110&startjd=2460193.104167&stopjd=2460194.104167&stepjd=0.1&max_altitude=80",
-        timeout=10,
-    )
-    # Check that the response was returned without error
-    assert response.status_code == 200
-
-    # with min and max altitude
-    response = requests.get(
-        "https://cps.iau.org/tools/satchecker/api/ephemeris/catalog-number-jdstep/?catalog=25544&elevation=150&latitude=32&longitude=-110&startjd=2460193.104167&stopjd=2460194.104167&stepjd=0.1&min_altitude=-90&max_altitude=80",
-        timeout=10,
-    )
-    # Check that the response was returned without error
-    assert response.status_code == 200
-
-    # with data_source (both)
-    response = requests.get(
-        "https://cps.iau.org/tools/satchecker/api/ephemeris/catalog-number-jdstep/?catalog=25544&elevation=150&latitude=32&longitude=-110&startjd=2460193.104167&stopjd=2460194.104167&stepjd=0.1&min_altitude=-90&data_source=celestrak",
-        timeout=10,
-    )
-    # Check that the response was returned without error
-    assert response.status_code == 200
-
-    response = requests.get(
-        "https://cps.iau.org/tools/satchecker/api/ephemeris/catalog-number-jdstep/?catalog=25544&elevation=150&latitude=32&longitude=-110&startjd=2460193.104167&stopjd=2460194.104167&stepjd=0.1&min_altitude=-90&data_source=spacetrack",
-        timeout=10,
-    )
-    # Check that the response was returned without error
-    assert response.status_code == 200
 
+@pytest.mark.parametrize("endpoint", ["tle", "tle-jdstep"])
+def test_ephemeris_missing_tle(http, endpoint):
+    # a missing TLE is a live-service behaviour (the testing app propagates
+    # the underlying error instead of rendering a 500 page)
+    with http.get(
+        ephemeris_url(endpoint, tle=None), timeout=TIMEOUT, stream=True
+    ) as response:
+        # Check that the response was returned with the correct error
+        assert response.status_code == 500
 
-def test_get_ephemeris_by_tle(client):
-    # correct request
-    response = requests.get(
-        "https://cps.iau.org/tools/satchecker/api/ephemeris/tle/?tle=ISS%20(ZARYA)%0A1%2025544U%2098067A%20%20%2023248.54842295%20%20.00012769%20%2000000+0%20%2022936-3%200%20%209997%0A2%2025544%20%2051.6416%20290.4299%200005730%20%2030.7454%20132.9751%2015.50238117414255&latitude=40.1106&longitude=-88.2073&elevation=222&julian_date=2460000.1&min_altitude=-90",
-        timeout=10,
-    )
-    # Check that the response was returned without error
-    assert response.status_code == 200
-
-    # elevation missing
-    response = requests.get(
-        "https://cps.iau.org/tools/satchecker/api/ephemeris/tle/?tle=ISS%20(ZARYA)%0A1%2025544U%2098067A%20%20%2023248.54842295%20%20.00012769%20%2000000+0%20%2022936-3%200%20%209997%0A2%2025544%20%2051.6416%20290.4299%200005730%20%2030.7454%20132.9751%2015.50238117414255&latitude=40.1106&longitude=-88.2073&julian_date=2460000.1&min_altitude=-90",
-        timeout=10,
-    )
-    # Check that the response has the correct status code
-    assert response.status_code == 400
-    # Check that the response contains the expected error message.
-    assert "Incorrect parameters" in response.text, "Incorrect error message returned"
 
-    # tle missing
-    response = requests.get(
-        "https://cps.iau.org/tools/satchecker/api/ephemeris/tle/?latitude=40.1106&longitude=-88.2073&elevation=222&julian_date=2460000.1&min_altitude=-90",
-        timeout=10,
-    )
-    # Check that the response was returned with the correct error
-    assert response.status_code == 500
-
-    # tle not formatted correctly
-    response = requests.get(
-        "https://cps.iau.org/tools/satchecker/api/ephemeris/tle/?tle=ISS%20(ZARYA)%0A1%2025544U%209812769%20%2000000+0%20%2022936-3%200%20%209997%0A2%2025544%20%2051.6416%20290.4299%200005730%20%2030.7454%20132.9751%2015.50238117414255&latitude=40.1106&longitude=-88.2073&elevation=222&julian_date=2460000.1&min_altitude=-90",
-        timeout=10,
-    )
+@pytest.mark.parametrize("endpoint", ["tle", "tle-jdstep"])
+def test_ephemeris_malformed_tle(validation_client, endpoint):
+    response = validation_client(endpoint, tle=MALFORMED_TLES[endpoint])
     # Check that the response was returned with the correct error
     assert response.status_code == 500
 
-    # latitude missing
-    response = requests.get(
-        "https://cps.iau.org/tools/satchecker/api/ephemeris/tle/?tle=ISS%20(ZARYA)%0A1%2025544U%2098067A%20%20%2023248.54842295%20%20.00012769%20%2000000+0%20%2022936-3%200%20%209997%0A2%2025544%20%2051.6416%20290.4299%200005730%20%2030.7454%20132.9751%2015.50238117414255&longitude=-88.2073&elevation=222&julian_date=2460000.1&min_altitude=-90",
-        timeout=10,
-    )
-    # Check that the response was returned with the correct error
-    assert response.status_code == 400
-    # Check that the response contains the expected error message.
-    assert "Incorrect parameters" in response.text, "Incorrect error message returned"
-
-    # longitude missing
-    response = requests.get(
-        "https://cps.iau.org/tools/satchecker/api/ephemeris/tle/?tle=ISS%20(ZARYA)%0A1%2025544U%2098067A%20%20%2023248.54842295%20%20.00012769%20%2000000+0%20%2022936-3%200%20%209997%0A2%2025544%20%2051.6416%20290.4299%200005730%20%2030.7454%20132.9751%2015.50238117414255&latitude=40.1106&elevation=222&julian_date=2460000.1&min_altitude=-90",
-        timeout=10,
-    )
-    # Check that the response was returned with the correct error
-    assert response.status_code == 400
-    # Check that the response contains the expected error message.
-    assert "Incorrect parameters" in response.text, "Incorrect error message returned"
-
-    # julian_date missing
-    response = requests.get(
-        "https://cps.iau.org/tools/satchecker/api/ephemeris/tle/?tle=ISS%20(ZARYA)%0A1%2025544U%2098067A%20%20%2023248.54842295%20%20.00012769%20%2000000+0%20%2022936-3%200%20%209997%0A2%2025544%20%2051.6416%20290.4299%200005730%20%2030.7454%20132.9751%2015.50238117414255&latitude=40.1106&longitude=-88.2073&elevation=222&min_altitude=-90",
-        timeout=10,
-    )
-    # Check that the response was returned with the correct error
-    assert response.status_code == 400
-    # Check that the response contains the expected error message.
-    assert "Incorrect parameters" in response.text, "Incorrect error message returned"
-
-    # with min_altitude
-    response = requests.get(
-        "https://cps.iau.org/tools/satchecker/api/ephemeris/tle/?tle=ISS%20(ZARYA)%0A1%2025544U%2098067A%20%20%2023248.54842295%20%20.00012769%20%2000000+0%20%2022936-3%200%20%209997%0A2%2025544%20%2051.6416%20290.4299%200005730%20%2030.7454%20132.9751%2015.50238117414255&latitude=40.1106&longitude=-88.2073&elevation=222&julian_date=2460000.1&min_altitude=-90",
-        timeout=10,
-    )
-    # Check that the response was returned without error
-    assert response.status_code == 200
-
-    # with max altitude
-    response = requests.get(
-        "https://cps.iau.org/tools/satchecker/api/ephemeris/tle/?tle=ISS%20(ZARYA)%0A1%2025544U%2098067A%20%20%2023248.54842295%20%20.00012769%20%2000000+0%20%2022936-3%200%20%209997%0A2%2025544%20%2051.6416%20290.4299%200005730%20%2030.7454%20132.9751%2015.50238117414255&latitude=40.1106&longitude=-88.2073&elevation=222&julian_date=2460000.1&max_altitude=80",
-        timeout=10,
-    )
-    # Check that the response was returned without error
-    assert response.status_code == 200
-
-    # with min and max altitude
-    response = requests.get(
-        "https://cps.iau.org/tools/satchecker/api/ephemeris/tle/?tle=ISS%20(ZARYA)%0A1%2025544U%2098067A%20%20%2023248.54842295%20%20.00012769%20%2000000+0%20%2022936-3%200%20%209997%0A2%2025544%20%2051.6416%20290.4299%200005730%20%2030.7454%20132.9751%2015.50238117414255&latitude=40.1106&longitude=-88.2073&elevation=222&julian_date=2460000.1&min_altitude=-90&max_altitude=80",
-        timeout=10,
-    )
-    # Check that the response was returned without error
-    assert response.status_code == 200
 
-    # with data_source (both)
-    response = requests.get(
-        "https://cps.iau.org/tools/satchecker/api/ephemeris/tle/?tle=ISS%20(ZARYA)%0A1%2025544U%2098067A%20%20%2023248.54842295%20%20.00012769%20%2000000+0%20%2022936-3%200%20%209997%0A2%2025544%20%2051.6416%20290.4299%200005730%20%2030.7454%20132.9751%2015.50238117414255&latitude=40.1106&longitude=-88.2073&elevation=222&julian_date=2460000.1&min_altitude=-90&data_source=celestrak",
-        timeout=10,
-    )
-    # Check that the response was returned without error
-    assert response.status_code == 200
-
-    response = requests.get(
-        "https://cps.iau.org/tools/satchecker/api/ephemeris/tle/?tle=ISS%20(ZARYA)%0A1%2025544U%2098067A%20%20%2023248.54842295%20%20.00012769%20%2000000+0%20%2022936-3%200%20%209997%0A2%2025544%20%2051.6416%20290.4299%200005730%20%2030.7454%20132.9751%2015.50238117414255&latitude=40.1106&longitude=-88.2073&elevation=222&julian_date=2460000.1&min_altitude=-90&data_source=spacetrack",
-        timeout=10,
-    )
+@pytest.mark.parametrize("endpoint", ENDPOINTS)
+@pytest.mark.parametrize("altitude", ALTITUDE_FILTERS)
+def test_ephemeris_altitude_filters(prefetched, endpoint, altitude):
+    response = prefetched[ephemeris_url(endpoint, **altitude)]
     # Check that the response was returned without error
     assert response.status_code == 200
 
 
-def test_get_ephemeris_by_tle_jdstep(client):
-    # correct request
-    response = requests.get(
-        "https://cps.iau.org/tools/satchecker/api/ephemeris/tle-jdstep/?tle=ISS%20(ZARYA)%0A1%2025544U%2098067A%20%20%2023248.54842295%20%20.00012769%20%2000000+0%20%2022936-3%200%20%209997%0A2%2025544%20%2051.6416%20290.4299%200005730%20%2030.7454%20132.9751%2015.50238117414255&latitude=40.1106&longitude=-88.2073&elevation=222&startjd=2460000.1&stopjd=2460000.3",
-        timeout=10,
-    )
+@pytest.mark.parametrize("endpoint", ENDPOINTS)
+@pytest.mark.parametrize("data_source", ["celestrak", "spacetrack"])
+def test_ephemeris_data_source(prefetched, endpoint, data_source):
+    response = prefetched[ephemeris_url(endpoint, data_source=data_source)]
     # Check that the response was returned without error
     assert response.status_code == 200
 
-    # elevation missing
-    response = requests.get(
-        "https://cps.iau.org/tools/satchecker/api/ephemeris/tle-jdstep/?tle=ISS%20(ZARYA)%0A1%2025544U%2098067A%20%20%2023248.54842295%20%20.00012769%20%2000000+0%20%2022936-3%200%20%209997%0A2%2025544%20%2051.6416%20290.4299%200005730%20%2030.7454%20132.9751%2015.50238117414255&latitude=40.1106&longitude=-88.2073&startjd=2460000.1&stopjd=2460000.3&stepjd=0.1",
-        timeout=10,
-    )
-    # Check that the response has the correct status code
-    assert response.status_code == 400
-    # Check that the response contains the expected error message.
-    assert "Incorrect parameters" in response.text, "Incorrect error message returned"
 
-    # tle missing
-    response = requests.get(
-        "https://cps.iau.org/tools/satchecker/api/ephemeris/tle-jdstep/?latitude=40.1106&longitude=-88.2073&elevation=222&startjd=2460000.1&stopjd=2460000.3&stepjd=0.1&min_altitude=-90",
-        timeout=10,
-    )
-    # Check that the response was returned with the correct error
-    assert response.status_code == 500
-
-    # tle not correctly formatted
-    response = requests.get(
-        "https://cps.iau.org/tools/satchecker/api/ephemeris/tle-jdstep/?tle=ISS%20(ZARYA)%0A1%202554420%2000000+0%20%2022936-3%200%20%209997%0A2%2025544%20%2051.6416%20290.4299%200005730%20%2030.7454%20132.9751%2015.50238117414255&latitude=40.1106&longitude=-88.2073&elevation=222&startjd=2460000.1&stopjd=2460000.3",
-        timeout=10,
-    )
-    # Check that the response was returned with the correct error
-    assert response.status_code == 500
-
-    # latitude missing
-    response = requests.get(
-        "https://cps.iau.org/tools/satchecker/api/ephemeris/tle-jdstep/?tle=ISS%20(ZARYA)%0A1%2025544U%2098067A%20%20%2023248.54842295%20%20.00012769%20%2000000+0%20%2022936-3%200%20%209997%0A2%2025544%20%2051.6416%20290.4299%200005730%20%2030.7454%20132.9751%2015.50238117414255&longitude=-88.2073&elevation=222&startjd=2460000.1&stopjd=2460000.3&stepjd=0.1",
-        timeout=10,
+@pytest.mark.slow
+def test_ephemeris_name_response_data(http):
+    # verify response data
+    response = http.get(
+        ephemeris_url("name", min_altitude=-90, max_altitude=80), timeout=TIMEOUT
     )
-    # Check that the response was returned with the correct error
-    assert response.status_code == 400
-    # Check that the response contains the expected error message.
-    assert "Incorrect parameters" in response.text, "Incorrect error message returned"
-
-    # longitude missing
-    response = requests.get(
-        "https://cps.iau.org/tools/satchecker/api/ephemeris/tle-jdstep/?tle=ISS%20(ZARYA)%0A1%2025544U%2098067A%20%20%2023248.54842295%20%20.00012769%20%2000000+0%20%2022936-3%200%20%209997%0A2%2025544%20%2051.6416%20290.4299%200005730%20%2030.7454%20132.9751%2015.50238117414255&latitude=40.1106&elevation=222&startjd=2460000.1&stopjd=2460000.3&stepjd=0.1",
-        timeout=10,
+    data = parse_json(response)
+    assert {k: data[0][k] for k in EXPECTED_EPHEMERIS_APPROX} == pytest.approx(
+        EXPECTED_EPHEMERIS_APPROX, rel=REL_TOL
     )
-    # Check that the response was returned with the correct error
-    assert response.status_code == 400
-    # Check that the response contains the expected error message.
-    assert "Incorrect parameters" in response.text, "Incorrect error message returned"
-
-    # startjd missing
-    response = requests.get(
-        "https://cps.iau.org/tools/satchecker/api/ephemeris/tle-jdstep/?tle=ISS%20(ZARYA)%0A1%2025544U%2098067A%20%20%2023248.54842295%20%20.00012769%20%2000000+0%20%2022936-3%200%20%209997%0A2%2025544%20%2051.6416%20290.4299%200005730%20%2030.7454%20132.9751%2015.50238117414255&latitude=40.1106&longitude=-88.2073&elevation=222&stopjd=2460000.3&stepjd=0.1",
-        timeout=10,
+    assert {k: data[0][k] for k in EXPECTED_EPHEMERIS_EXACT} == EXPECTED_EPHEMERIS_EXACT
+    assert data[0]["OBSERVER_GCRS_KM"] == pytest.approx(
+        [-147.12272716510805, 5412.091101268944, 3360.663968123699],
+        rel=REL_TOL,
     )
-    # Check that the response was returned with the correct error
-    assert response.status_code == 400
-    # Check that the response contains the expected error message.
-    assert "Incorrect parameters" in response.text, "Incorrect error message returned"
-
-    # stopjd missing
-    response = requests.get(
-        "https://cps.iau.org/tools/satchecker/api/ephemeris/tle-jdstep/?tle=ISS%20(ZARYA)%0A1%2025544U%2098067A%20%20%2023248.54842295%20%20.00012769%20%2000000+0%20%2022936-3%200%20%209997%0A2%2025544%20%2051.6416%20290.4299%200005730%20%2030.7454%20132.9751%2015.50238117414255&latitude=40.1106&longitude=-88.2073&elevation=222&startjd=2460000.1&stepjd=0.1",
-        timeout=10,
+    assert data[0]["SATELLITE_GCRS_KM"] == pytest.approx(
+        [1554.4639759227455, -6619.6547574595015, -371.09162717694767],
+        rel=REL_TOL,
     )
-    # Check that the response was returned with the correct error
-    assert response.status_code == 400
-    # Check that the response contains the expected error message.
-    assert "Incorrect parameters" in response.text, "Incorrect error message returned"
 
-    # with min_altitude
-    response = requests.get(
-        "https://cps.iau.org/tools/satchecker/api/ephemeris/tle-jdstep/?tle=ISS%20(ZARYA)%0A1%2025544U%2098067A%20%20%2023248.54842295%20%20.00012769%20%2000000+0%20%2022936-3%200%20%209997%0A2%2025544%20%2051.6416%20290.4299%200005730%20%2030.7454%20132.9751%2015.50238117414255&latitude=40.1106&longitude=-88.2073&elevation=222&startjd=2460000.1&stopjd=2460000.3&stepjd=0.1&min_altitude=-90",
-        timeout=10,
-    )
-    # Check that the response was returned without error
-    assert response.status_code == 200
 
-    # with max altitude
-    response = requests.get(
-        "https://cps.iau.org/tools/satchecker/api/ephemeris/tle-jdstep/?tle=ISS%20(ZARYA)%0A1%2025544U%2098067A%20%20%2023248.54842295%20%20.00012769%20%2000000+0%20%2022936-3%200%20%209997%0A2%2025544%20%2051.6416%20290.4299%200005730%20%2030.7454%20132.9751%2015.50238117414255&latitude=40.1106&longitude=-88.2073&elevation=222&startjd=2460000.1&stopjd=2460000.3&stepjd=0.1&max_altitude=80",
-        timeout=10,
+@pytest.mark.slow
+@pytest.mark.parametrize("endpoint", ENDPOINTS)
+def test_bench_ephemeris(benchmark, http, endpoint):
+    """Per-endpoint latency gate; compare runs with --benchmark-autosave and
+    --benchmark-compare to catch endpoint-level performance regressions."""
+    # refresh=True bypasses the response cache so the live service is timed
+    response = benchmark(
+        http.get, ephemeris_url(endpoint), timeout=TIMEOUT, refresh=True
     )
-    # Check that the response was returned without error
     assert response.status_code == 200
 
-    # with min and max altitude
-    response = requests.get(
-        "https://cps.iau.org/tools/satchecker/api/ephemeris/tle-jdstep/?tle=ISS%20(ZARYA)%0A1%2025544U%2098067A%20%20%2023248.54842295%20%20.00012769%20%2000000+0%20%2022936-3%200%20%209997%0A2%2025544%20%2051.6416%20290.4299%200005730%20%2030.7454%20132.9751%2015.50238117414255&latitude=40.1106&longitude=-88.2073&elevation=222&startjd=2460000.1&stopjd=2460000.3&stepjd=0.1&min_altitude=-90&max_altitude=80",
-        timeout=10,
-    )
-    # Check that the response was returned without error
-    assert response.status_code == 200
 
-    # with data_source (both)
-    response = requests.get(
-        "https://cps.iau.org/tools/satchecker/api/ephemeris/tle-jdstep/?tle=ISS%20(ZARYA)%0A1%2025544U%2098067A%20%20%2023248.54842295%20%20.00012769%20%2000000+0%20%2022936-3%200%20%209997%0A2%2025544%20%2051.6416%20290.4299%200005730%20%2030.7454%20132.9751%2015.50238117414255&latitude=40.1106&longitude=-88.2073&elevation=222&startjd=2460000.1&stopjd=2460000.3&stepjd=0.1&min_altitude=-90&data_source=celestrak",
-        timeout=10,
-    )
-    # Check that the response was returned without error
-    assert response.status_code == 200
+def assert_bad_request(response, msg=b"Incorrect parameters"):
+    """Assert a 400 with the expected error message, matched on the raw
+    bytes so the body is never decoded to str."""
+    assert response.status_code == 400
+    assert msg in response.content, "Incorrect error message returned"
 
-    response = requests.get(
-        "https://cps.iau.org/tools/satchecker/api/ephemeris/tle-jdstep/?tle=ISS%20(ZARYA)%0A1%2025544U%2098067A%20%20%2023248.54842295%20%20.00012769%20%2000000+0%20%2022936-3%200%20%209997%0A2%2025544%20%2051.6416%20290.4299%200005730%20%2030.7454%20132.9751%2015.50238117414255&latitude=40.1106&longitude=-88.2073&elevation=222&startjd=2460000.1&stopjd=2460000.3&stepjd=0.1&min_altitude=-90&data_source=spacetrack",
-        timeout=10,
-    )
-    # Check that the response was returned without error
-    assert response.status_code == 200
 
+def _fetch_all(http, urls):
+    """Fetch independent URLs concurrently with the shared session."""
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        return list(executor.map(lambda u: http.get(u, timeout=TIMEOUT), urls))
 
-def test_get_names_from_norad_id(client):
-    # one name found
-    response = requests.get(
-        "https://cps.iau.org/tools/satchecker/api/tools/names-from-norad-id/?id=25544",
-        timeout=10,
-    )
-    # Check that the response was returned without error
-    assert response.status_code == 200
 
-    # multiple names found
-    response = requests.get(
-        "https://cps.iau.org/tools/satchecker/api/tools/names-from-norad-id/?id=59582",
-        timeout=10,
+def test_get_names_from_norad_id(client, http):
+    one_name, multiple_names, no_names = _fetch_all(
+        http,
+        [
+            # one name found
+            tools_url("names-from-norad-id", id=25544),
+            # multiple names found
+            tools_url("names-from-norad-id", id=59582),
+            # no names found
+            tools_url("names-from-norad-id", id=1),
+        ],
     )
-    # Check that the response was returned without error
-    assert response.status_code == 200
-    data = response.json()
+    # Check that the responses were returned without error
+    assert one_name.status_code == 200
+    assert multiple_names.status_code == 200
+    data = parse_json(multiple_names)
     assert data[1] != []
-
-    # no names found
-    response = requests.get(
-        "https://cps.iau.org/tools/satchecker/api/tools/names-from-norad-id/?id=1",
-        timeout=10,
-    )
-    # Check that the response was returned without error
-    assert response.status_code == 200
-    assert response.json() == []
+    assert no_names.status_code == 200
+    assert parse_json(no_names) == []
 
     # norad id missing
-    response = requests.get(
-        "https://cps.iau.org/tools/satchecker/api/tools/names-from-norad-id/",
-        timeout=10,
-    )
+    response = http.get(tools_url("names-from-norad-id"), timeout=TIMEOUT)
     # Check that the response was returned with the correct error
-    assert response.status_code == 400
-    # Check that the response contains the expected error message.
-    assert "Incorrect parameters" in response.text, "Incorrect error message returned"
-
-
-def test_get_norad_ids_from_name(client):
-    # one norad id found
-    response = requests.get(
-        "https://cps.iau.org/tools/satchecker/api/tools/norad-ids-from-name/?name=ISS%20(ZARYA)",
-        timeout=10,
-    )
-    # Check that the response was returned without error
-    assert response.status_code == 200
-
-    # multiple norad ids found
-    response = requests.get(
-        "https://cps.iau.org/tools/satchecker/api/tools/norad-ids-from-name/?name=STARLINK-31000",
-        timeout=10,
-    )
-    # Check that the response was returned without error and has multiple ids
-    assert response.status_code == 200
-    data = response.json()
+    assert_bad_request(response)
+
+
+def test_get_norad_ids_from_name(client, http):
+    one_id, multiple_ids, no_ids = _fetch_all(
+        http,
+        [
+            # one norad id found
+            tools_url("norad-ids-from-name", name=_ISS_NAME),
+            # multiple norad ids found
+            tools_url("norad-ids-from-name", name="STARLINK-31000"),
+            # no norad ids found
+            tools_url("norad-ids-from-name", name="STARLINK-11300"),
+        ],
+    )
+    # Check that the responses were returned without error
+    assert one_id.status_code == 200
+    assert multiple_ids.status_code == 200
+    data = parse_json(multiple_ids)
     assert data[1] != []
-
-    # no norad ids found
-    response = requests.get(
-        "https://cps.iau.org/tools/satchecker/api/tools/norad-ids-from-name/?name=STARLINK-11300",
-        timeout=10,
-    )
-    # Check that the response was returned without error
-    assert response.status_code == 200
+    assert no_ids.status_code == 200
 
     # name missing
-    response = requests.get(
-        "https://cps.iau.org/tools/satchecker/api/tools/norad-ids-from-name/",
-        timeout=10,
-    )
+    response = http.get(tools_url("norad-ids-from-name"), timeout=TIMEOUT)
     # Check that the response was returned with the correct error
-    assert response.status_code == 400
-    # Check that the response contains the expected error message.
-    assert "Incorrect parameters" in response.text, "Incorrect error message returned"
-
-
-def test_get_tle_data(client):
-
-    # norad id as id
-    response = requests.get(
-        "https://cps.iau.org/tools/satchecker/api/tools/get-tle-data/?id=25544&id_type=catalog",
-        timeout=10,
-    )
-    # Check that the response was returned without error
-    assert response.status_code == 200
-
-    # no TLE data found
-    response = requests.get(
-        "https://cps.iau.org/tools/satchecker/api/tools/get-tle-data/?id=1&id_type=catalog",
-        timeout=10,
-    )
-    # Check that the response was returned without error
-    assert response.status_code == 200
-    assert response.json() == []
-
-    # name as id
-    response = requests.get(
-        "https://cps.iau.org/tools/satchecker/api/tools/get-tle-data/?id=ISS%20(ZARYA)&id_type=name",
-        timeout=10,
-    )
-    # Check that the response was returned without error
-    assert response.status_code == 200
-
-    # with start date
-    response = requests.get(
-        "https://cps.iau.org/tools/satchecker/api/tools/get-tle-data/?id=ISS%20(ZARYA)&id_type=name&start_date=2460425",
-        timeout=10,
-    )
-    # Check that the response was returned without error
-    assert response.status_code == 200
-
-    # with end date
-    response = requests.get(
-        "https://cps.iau.org/tools/satchecker/api/tools/get-tle-data/?id=ISS%20(ZARYA)&id_type=name&end_date=2460427",
-        timeout=10,
-    )
-    # Check that the response was returned without error
-    assert response.status_code == 200
-
-    # with start and end date
-    response = requests.get(
-        "https://cps.iau.org/tools/satchecker/api/tools/get-tle-data/?id=25544&id_type=catalog&start_date_jd=2460425&end_date_jd=2460427",
-        timeout=10,
-    )
-    assert response.status_code == 200
-
-    data = response.json()
-    assert data[0]["satellite_name"] == "ISS (ZARYA)"
-    assert data[0]["date_collected"] == "2024-04-26 01:31:05 UTC"
-    assert data[0]["epoch"] == "2024-04-25 18:22:37 UTC"
-    assert data[0]["satellite_id"] == 25544
-    assert (
-        data[0]["tle_line1"]
-        == "1 25544U 98067A   24116.76570894  .00062894  00000+0  10654-2 0  9996"
-    )
-    assert (
-        data[0]["tle_line2"]
-        == "2 25544  51.6396 215.3361 0004566  95.7745   7.6568 15.50926567450413"
-    )
+    assert_bad_request(response)
+
+
+def test_get_tle_data(client, http):
+    responses = _fetch_all(
+        http,
+        [
+            # norad id as id
+            tools_url("get-tle-data", id=25544, id_type="catalog"),
+            # no TLE data found
+            tools_url("get-tle-data", id=1, id_type="catalog"),
+            # name as id
+            tools_url("get-tle-data", id=_ISS_NAME, id_type="name"),
+            # with start date
+            tools_url("get-tle-data", id=_ISS_NAME, id_type="name", start_date=2460425),
+            # with end date
+            tools_url("get-tle-data", id=_ISS_NAME, id_type="name", end_date=2460427),
+            # with start and end date
+            tools_url(
+                "get-tle-data",
+                id=25544,
+                id_type="catalog",
+                start_date_jd=2460425,
+                end_date_jd=2460427,
+            ),
+        ],
+    )
+    # Check that the responses were returned without error
+    for response in responses:
+        assert response.status_code == 200
+    assert parse_json(responses[1]) == []
+
+    # the start-and-end-date case pins the returned row exactly
+    data = parse_json(responses[-1])
+    assert {key: data[0][key] for key in EXPECTED_TLE_ROW} == EXPECTED_TLE_ROW
 
     # id missing
-    response = requests.get(
-        "https://cps.iau.org/tools/satchecker/api/tools/get-tle-data/?id_type=name",
-        timeout=10,
-    )
+    response = http.get(tools_url("get-tle-data", id_type="name"), timeout=TIMEOUT)
     # Check that the response was returned with the correct error
-    assert response.status_code == 400
-    # Check that the response contains the expected error message.
-    assert "Incorrect parameters" in response.text, "Incorrect error message returned"
+    assert_bad_request(response)